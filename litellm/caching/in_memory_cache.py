@@ -13,6 +13,7 @@ import json
 import sys
 import threading
 import time
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -32,10 +33,14 @@ class InMemoryCache(BaseCache):
         default_ttl: int
         | None = 600,  # default ttl is 10 minutes. At maximum litellm rate limiting logic requires objects to be in memory for 1 minute
         max_size_per_item: int | None = 1024,  # 1MB = 1024KB
+        time_fn: Callable[[], float] | None = None,
     ):
         """
         max_size_in_memory [int]: Maximum number of items in cache. done to prevent memory leaks. Use 200 items as a default
+
+        time_fn [Callable]: Clock used for TTL bookkeeping. Defaults to time.time; tests inject a fake clock to exercise expiry without sleeping.
         """
+        self._time = time_fn if time_fn is not None else time.time
         self.max_size_in_memory = (
             max_size_in_memory if max_size_in_memory is not None else 200
         )  # set an upper bound of 200 items in-memory
@@ -47,6 +52,11 @@ class InMemoryCache(BaseCache):
         self.ttl_dict: dict = {}
         self.expiration_heap: list[tuple[float, str]] = []
         self._increment_lock = threading.Lock()
+        # Striped locks: increments on different keys rarely contend (1/64
+        # collision chance) while same-key increments stay serialized. The
+        # global _increment_lock is still taken on the fallback path, which
+        # mutates shared TTL/heap state via set_cache.
+        self._increment_lock_stripes = tuple(threading.Lock() for _ in range(64))
 
     def check_value_size(self, value: Any):
         """
@@ -89,7 +99,7 @@ class InMemoryCache(BaseCache):
         """
         Check if a specific key is expired
         """
-        return key in self.ttl_dict and time.time() > self.ttl_dict[key]
+        return key in self.ttl_dict and self._time() > self.ttl_dict[key]
 
     def _remove_key(self, key: str) -> None:
         """
@@ -98,7 +108,7 @@ class InMemoryCache(BaseCache):
         self.cache_dict.pop(key, None)
         self.ttl_dict.pop(key, None)
 
-    def evict_cache(self):
+    def evict_cache(self, current_time: float | None = None):
         """
         Eviction policy:
         1. First, remove expired items from ttl_dict and cache_dict
@@ -111,7 +121,8 @@ class InMemoryCache(BaseCache):
         - 3. the size of in-memory cache is bounded
 
         """
-        current_time = time.time()
+        if current_time is None:
+            current_time = self._time()
 
         # Step 1: Remove expired or outdated items
         while self.expiration_heap:
@@ -140,12 +151,14 @@ class InMemoryCache(BaseCache):
         # One of the most common causes of memory leaks in Python is the retention of objects that are no longer being used.
         # This can occur when an object is referenced by another object, but the reference is never removed.
 
-    def allow_ttl_override(self, key: str) -> bool:
+    def allow_ttl_override(self, key: str, current_time: float | None = None) -> bool:
         """
         Check if ttl is set for a key
         """
         ttl_time = self.ttl_dict.get(key)
-        if ttl_time is None or float(ttl_time) < time.time():  # if ttl is not set, allow override
+        if current_time is None:
+            current_time = self._time()
+        if ttl_time is None or float(ttl_time) < current_time:  # if ttl is not set, allow override
             return True
         else:
             return False
@@ -155,21 +168,24 @@ class InMemoryCache(BaseCache):
         if self.max_size_in_memory == 0:
             return  # Don't cache anything if max size is 0
 
+        # Read the clock once per set; eviction, TTL-override checks and the
+        # new expiry all use the same timestamp.
+        now = self._time()
+
         # Always prune expired/outdated heap roots before inserting.
         # This keeps expiration_heap bounded even when the live cache stays
         # below max_size_in_memory and keys are reinserted after TTL expiry.
-        self.evict_cache()
+        self.evict_cache(current_time=now)
         if not self.check_value_size(value):
             return
 
         self.cache_dict[key] = value
-        if self.allow_ttl_override(key):  # if ttl is not set, set it to default ttl
+        if self.allow_ttl_override(key, current_time=now):  # if ttl is not set, set it to default ttl
             if "ttl" in kwargs and kwargs["ttl"] is not None:
-                self.ttl_dict[key] = time.time() + float(kwargs["ttl"])
-                heapq.heappush(self.expiration_heap, (self.ttl_dict[key], key))
+                self.ttl_dict[key] = now + float(kwargs["ttl"])
             else:
-                self.ttl_dict[key] = time.time() + self.default_ttl
-                heapq.heappush(self.expiration_heap, (self.ttl_dict[key], key))
+                self.ttl_dict[key] = now + self.default_ttl
+            heapq.heappush(self.expiration_heap, (self.ttl_dict[key], key))
 
     async def async_set_cache(self, key, value, **kwargs):
         self.set_cache(key=key, value=value, **kwargs)
@@ -222,13 +238,29 @@ class InMemoryCache(BaseCache):
             return_val.append(val)
         return return_val
 
+    def _lock_for(self, key: str) -> threading.Lock:
+        return self._increment_lock_stripes[hash(key) & 63]
+
     def increment_cache(self, key, value: float, **kwargs) -> float:
-        with self._increment_lock:
-            # keep read-modify-write atomic
-            init_value = self.get_cache(key=key) or 0
-            value = init_value + value
-            self.set_cache(key, value, **kwargs)
-            return value
+        with self._lock_for(key):
+            # Fast path for live numeric counters (the rate-limit hot path):
+            # a single dict read + add + write, skipping the json decode in
+            # get_cache and the heap maintenance in set_cache. TTL is
+            # untouched, matching set_cache's allow_ttl_override behavior for
+            # unexpired keys.
+            existing = self.cache_dict.get(key)
+            if isinstance(existing, (int, float)) and not self._is_key_expired(key):
+                new_value = existing + value
+                self.cache_dict[key] = new_value
+                return new_value
+
+            # keep read-modify-write atomic; the global lock serializes the
+            # shared TTL/heap mutations inside set_cache across stripes
+            with self._increment_lock:
+                init_value = self.get_cache(key=key) or 0
+                value = init_value + value
+                self.set_cache(key, value, **kwargs)
+                return value
 
     async def async_get_cache(self, key, **kwargs):
         return self.get_cache(key=key, **kwargs)
@@ -2170,11 +2170,16 @@ def batch_cost_calculator(
     return total_prompt_cost, total_completion_cost
 
 
-def _summable_prompt_token_fields(prompt_tokens_details: BaseModel) -> list[str]:
-    field_names = list(type(prompt_tokens_details).model_fields)
+@lru_cache(maxsize=None)
+def _public_model_field_names(model_cls: type[BaseModel]) -> tuple[str, ...]:
+    return tuple(name for name in model_cls.model_fields if not name.startswith("_"))
+
+
+def _summable_prompt_token_fields(prompt_tokens_details: BaseModel) -> tuple[str, ...]:
+    field_names = _public_model_field_names(type(prompt_tokens_details))
     if getattr(prompt_tokens_details, "cache_write_tokens", None) is None:
         return field_names
-    return [attr for attr in field_names if attr != "cache_creation_tokens"]
+    return tuple(attr for attr in field_names if attr != "cache_creation_tokens")
 
 
 class BaseTokenUsageProcessor:
@@ -2191,35 +2196,32 @@ class BaseTokenUsageProcessor:
 
         combined = Usage()
 
+        # Allocate nested wrappers once up front instead of re-checking
+        # combined's state on every usage object in the loop below
+        if any(getattr(usage, "prompt_tokens_details", None) for usage in usage_objects):
+            combined.prompt_tokens_details = PromptTokensDetailsWrapper()
+        if any(getattr(usage, "completion_tokens_details", None) for usage in usage_objects):
+            combined.completion_tokens_details = CompletionTokensDetailsWrapper()
+
         # Sum basic token counts
         for usage in usage_objects:
-            # Handle direct attributes by checking what exists in the model
-            for attr in dir(usage):
-                if not attr.startswith("_") and not callable(getattr(usage, attr)):
-                    current_val = getattr(combined, attr, 0)
-                    new_val = getattr(usage, attr, 0)
-                    if (
-                        new_val is not None
-                        and isinstance(new_val, (int, float))
-                        and isinstance(current_val, (int, float))
-                    ):
-                        setattr(combined, attr, current_val + new_val)
+            # Iterate the class's declared fields (cached per class) instead of
+            # dir(), which allocates and sorts the full attribute list and
+            # re-getattrs every entry for a callable check on each usage object
+            for attr in _public_model_field_names(type(usage)):
+                current_val = getattr(combined, attr, 0)
+                new_val = getattr(usage, attr, None)
+                if new_val is not None and isinstance(new_val, (int, float)) and isinstance(current_val, (int, float)):
+                    setattr(combined, attr, current_val + new_val)
             # Handle nested prompt_tokens_details
             if hasattr(usage, "prompt_tokens_details") and usage.prompt_tokens_details:
-                if not hasattr(combined, "prompt_tokens_details") or not combined.prompt_tokens_details:
-                    combined.prompt_tokens_details = PromptTokensDetailsWrapper()
-
                 # Check what keys exist in the model's prompt_tokens_details
                 # Access model_fields on the class, not the instance, to avoid Pydantic 2.11+ deprecation warnings
                 for attr in _summable_prompt_token_fields(usage.prompt_tokens_details):
-                    if (
-                        hasattr(usage.prompt_tokens_details, attr)
-                        and not attr.startswith("_")
-                        and not callable(getattr(usage.prompt_tokens_details, attr))
-                    ):
+                    if hasattr(usage.prompt_tokens_details, attr):
                         current_val = getattr(combined.prompt_tokens_details, attr, 0) or 0
                         new_val = getattr(usage.prompt_tokens_details, attr, 0) or 0
-                        if new_val is not None and isinstance(new_val, (int, float)):
+                        if isinstance(new_val, (int, float)):
                             setattr(
                                 combined.prompt_tokens_details,
                                 attr,
@@ -2228,13 +2230,10 @@ class BaseTokenUsageProcessor:
 
             # Handle nested completion_tokens_details
             if hasattr(usage, "completion_tokens_details") and usage.completion_tokens_details:
-                if not hasattr(combined, "completion_tokens_details") or not combined.completion_tokens_details:
-                    combined.completion_tokens_details = CompletionTokensDetailsWrapper()
-
                 # Check what keys exist in the model's completion_tokens_details
                 # Access model_fields on the class, not the instance, to avoid Pydantic 2.11+ deprecation warnings
-                for attr in type(usage.completion_tokens_details).model_fields:
-                    if not attr.startswith("_") and not callable(getattr(usage.completion_tokens_details, attr)):
+                for attr in _public_model_field_names(type(usage.completion_tokens_details)):
+                    if hasattr(usage.completion_tokens_details, attr):
                         current_val = getattr(combined.completion_tokens_details, attr, 0) or 0
                         new_val = getattr(usage.completion_tokens_details, attr, 0) or 0
                         if isinstance(new_val, (int, float)):
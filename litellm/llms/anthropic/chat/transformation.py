@@ -1661,9 +1661,10 @@ class AnthropicConfig(AnthropicModelInfo, BaseConfig):
 
                         anthropic_system_message_list.append(anthropic_system_message_content)
 
-        if len(system_prompt_indices) > 0:
-            for idx in reversed(system_prompt_indices):
-                messages.pop(idx)
+        if system_prompt_indices:
+            messages[:] = [  # mutable-ok: callers rely on in-place removal from their list
+                message for message in messages if message["role"] != "system"
+            ]
 
         return anthropic_system_message_list
 
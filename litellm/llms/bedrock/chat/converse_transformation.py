@@ -161,8 +161,11 @@ class AmazonConverseConfig(BaseConfig):
         if not consecutive_user_message_indices:
             return messages
 
-        # Process each consecutive user message
-        messages_copy = copy.deepcopy(messages)
+        # Process each consecutive user message. A shallow per-message copy is
+        # enough: only the top-level "content" key is reassigned below, and
+        # replaced text items are fresh dicts, so nested caller state is never
+        # written to.
+        messages_copy = [dict(message) for message in messages]  # mutable-ok: content is reassigned on the copies
         for user_message_index in consecutive_user_message_indices:
             user_message = messages_copy[user_message_index]
             content = user_message.get("content", [])
@@ -1161,9 +1164,10 @@ class AmazonConverseConfig(BaseConfig):
                             cache_block = self._get_cache_point_block(m, block_type="system", model=model)
                             if cache_block:
                                 system_content_blocks.append(cache_block)
-        if len(system_prompt_indices) > 0:
-            for idx in reversed(system_prompt_indices):
-                messages.pop(idx)
+        if system_prompt_indices:
+            messages[:] = [  # mutable-ok: callers rely on in-place removal from their list
+                message for message in messages if message["role"] != "system"
+            ]
         return messages, system_content_blocks
 
     def _transform_inference_params(self, inference_params: dict) -> InferenceConfig:
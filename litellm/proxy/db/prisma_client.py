@@ -220,6 +220,9 @@ class PrismaWrapper:
 
         # Background token refresh task management
         self._token_refresh_task: asyncio.Task | None = None
+        self._fallback_refresh_task: asyncio.Task | None = None
+        self._token_expiry_cache: tuple[str, datetime | None] | None = None
+        self._cached_db_url: str | None = None
         self._reconnection_lock = asyncio.Lock()
         self._last_refresh_time: datetime | None = None
         self._active_drain_tracker = self._instrument_prisma_client(original_prisma)
@@ -436,12 +439,23 @@ class PrismaWrapper:
         return max(0, seconds_until_refresh)
 
     def is_token_expired(self, token_url: str | None) -> bool:
-        """Check if the token in the given URL is expired."""
+        """Check if the token in the given URL is expired.
+
+        Called on every proxied attribute access, so the URL parse + token
+        expiry decode is cached per URL. The cached value is the parsed
+        expiration timestamp, not the boolean, so the answer stays exact as
+        time passes; a refreshed token changes the URL and misses the cache.
+        """
         if token_url is None:
             return True
 
-        token = self._extract_token_from_db_url(token_url)
-        expiration_time = self._parse_token_expiration(token)
+        cached = self._token_expiry_cache
+        if cached is not None and cached[0] == token_url:
+            expiration_time = cached[1]
+        else:
+            token = self._extract_token_from_db_url(token_url)
+            expiration_time = self._parse_token_expiration(token)
+            self._token_expiry_cache = (token_url, expiration_time)
 
         if expiration_time is None:
             # If we can't parse the token, assume it's expired to trigger refresh
@@ -484,6 +498,7 @@ class PrismaWrapper:
                 _db_url += f"?schema={db_schema}"
 
         os.environ[self._db_url_env_var] = _db_url
+        self._cached_db_url = _db_url
         return _db_url
 
     async def recreate_prisma_client(
@@ -785,44 +800,62 @@ class PrismaWrapper:
         """
         original_attr = getattr(self._original_prisma, name)
 
-        if self.iam_token_db_auth:
-            db_url = os.getenv(self._db_url_env_var)
+        if not self.iam_token_db_auth:
+            return original_attr
 
-            # Check if token is expired (should be rare if background task is running)
-            if self.is_token_expired(db_url):
-                try:
-                    running_loop = asyncio.get_running_loop()
-                except RuntimeError:
-                    running_loop = None
-
-                if running_loop is not None:
-                    verbose_proxy_logger.warning(
-                        "%sRDS IAM token expired in __getattr__ — proactive refresh "
-                        "may have failed. Scheduling async refresh; the current "
-                        "request may fail and be retried with the fresh token.",
+        # Fast path avoids the os.environ proxy on every attribute access;
+        # the mirror is updated whenever this wrapper rotates the token.
+        db_url = self._cached_db_url
+        if db_url is None:
+            db_url = self._cached_db_url = os.getenv(self._db_url_env_var)
+
+        # Check if token is expired (should be rare if background task is
+        # running). Before escalating, re-read the env var once so an
+        # externally rotated URL is picked up without a refresh cycle.
+        token_expired = self.is_token_expired(db_url)
+        if token_expired:
+            refreshed_db_url = os.getenv(self._db_url_env_var)
+            if refreshed_db_url != db_url:
+                db_url = self._cached_db_url = refreshed_db_url
+                token_expired = self.is_token_expired(db_url)
+
+        if token_expired:
+            try:
+                running_loop = asyncio.get_running_loop()
+            except RuntimeError:
+                running_loop = None
+
+            if running_loop is not None:
+                verbose_proxy_logger.warning(
+                    "%sRDS IAM token expired in __getattr__ — proactive refresh "
+                    "may have failed. Scheduling async refresh; the current "
+                    "request may fail and be retried with the fresh token.",
+                    self._log_prefix,
+                )
+                # Non-blocking: schedule the locked refresh on the
+                # running loop. Single-flight: while a fallback refresh
+                # task is still pending, further attribute accesses reuse
+                # it instead of queueing more tasks behind the
+                # reconnection lock inside `_safe_refresh_token`.
+                if self._fallback_refresh_task is None or self._fallback_refresh_task.done():
+                    self._fallback_refresh_task = running_loop.create_task(self._safe_refresh_token())
+            else:
+                verbose_proxy_logger.warning(
+                    "%sRDS IAM token expired in __getattr__ — proactive refresh "
+                    "may have failed. Triggering synchronous fallback refresh...",
+                    self._log_prefix,
+                )
+                new_db_url = self.get_rds_iam_token()
+                if new_db_url:
+                    asyncio.run(self.recreate_prisma_client(new_db_url))
+                    # Re-fetch attribute against the recreated Prisma instance.
+                    original_attr = getattr(self._original_prisma, name)
+                    verbose_proxy_logger.info(
+                        "%sSynchronous token refresh completed successfully",
                         self._log_prefix,
                     )
-                    # Non-blocking: schedule the locked refresh on the
-                    # running loop. The reconnection lock inside
-                    # `_safe_refresh_token` coalesces concurrent triggers.
-                    running_loop.create_task(self._safe_refresh_token())
                 else:
-                    verbose_proxy_logger.warning(
-                        "%sRDS IAM token expired in __getattr__ — proactive refresh "
-                        "may have failed. Triggering synchronous fallback refresh...",
-                        self._log_prefix,
-                    )
-                    new_db_url = self.get_rds_iam_token()
-                    if new_db_url:
-                        asyncio.run(self.recreate_prisma_client(new_db_url))
-                        # Re-fetch attribute against the recreated Prisma instance.
-                        original_attr = getattr(self._original_prisma, name)
-                        verbose_proxy_logger.info(
-                            "%sSynchronous token refresh completed successfully",
-                            self._log_prefix,
-                        )
-                    else:
-                        raise ValueError("Failed to get RDS IAM token")
+                    raise ValueError("Failed to get RDS IAM token")
 
         return original_attr
 
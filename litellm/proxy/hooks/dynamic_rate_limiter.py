@@ -35,10 +35,22 @@ class DynamicRateLimiterCache:
         self.cache = cache
         self.ttl = 60  # 1 min ttl
         self.time_fn = time_fn
+        self._minute_key_cache: tuple[tuple[int, int], str] | None = None
 
-    async def async_get_cache(self, model: str) -> int | None:
+    def _current_minute(self) -> str:
+        """strftime is surprisingly costly on hot paths; cache the formatted
+        minute bucket until the clock ticks over to the next minute."""
         dt = self.time_fn()
+        bucket = (dt.hour, dt.minute)
+        cached = self._minute_key_cache
+        if cached is not None and cached[0] == bucket:
+            return cached[1]
         current_minute = dt.strftime("%H-%M")
+        self._minute_key_cache = (bucket, current_minute)
+        return current_minute
+
+    async def async_get_cache(self, model: str) -> int | None:
+        current_minute = self._current_minute()
         key_name = f"{current_minute}:{model}"
         _response = await self.cache.async_get_cache(key=key_name)
         response: int | None = None
@@ -61,8 +73,7 @@ class DynamicRateLimiterCache:
         - Exception, if unable to connect to cache client (if redis caching enabled)
         """
         try:
-            dt = self.time_fn()
-            current_minute = dt.strftime("%H-%M")
+            current_minute = self._current_minute()
 
             key_name = f"{current_minute}:{model}"
             await self.cache.async_set_cache_sadd(key=key_name, value=value, ttl=self.ttl)
@@ -117,11 +128,10 @@ class _PROXY_DynamicRateLimitHandler(CustomLogger):
                     value = litellm.priority_reservation[priority]
                     weight = convert_priority_to_percent(value, model_group_info)
 
-            active_projects = await self.internal_usage_cache.async_get_cache(model=model)
-            (
-                current_model_tpm,
-                current_model_rpm,
-            ) = await self.llm_router.get_model_group_usage(model_group=model)
+            active_projects, (current_model_tpm, current_model_rpm) = await asyncio.gather(
+                self.internal_usage_cache.async_get_cache(model=model),
+                self.llm_router.get_model_group_usage(model_group=model),
+            )
             total_model_tpm: int | None = None
             total_model_rpm: int | None = None
             if model_group_info is not None:
@@ -15,10 +15,11 @@ import inspect
 import json
 import logging
 import re
+import sys
 import threading
 import time
 import traceback
-from collections import defaultdict
+from collections import defaultdict, deque
 from collections.abc import AsyncGenerator, Callable, Generator, Mapping
 from functools import lru_cache
 from typing import (
@@ -558,6 +559,7 @@ class Router:
         # touches *before* the first ``set_model_list`` below (which calls
         # that invalidation as part of building the model index).
         self._access_groups_cache: dict[str, list[str]] | None = None
+        self._model_list_version: int = 0
         # Per-router cache for the proxy auth-layer "is this model explicitly
         # zero-cost?" check. Lives on the router so it is invalidated alongside
         # ``_cached_get_model_group_info`` and dies with the router (no
@@ -640,7 +642,9 @@ class Router:
         self.total_calls: defaultdict = defaultdict(int)  # dict to store total calls made to each model
         self.fail_calls: defaultdict = defaultdict(int)  # dict to store fail_calls made to each model
         self.success_calls: defaultdict = defaultdict(int)  # dict to store success_calls  made to each model
-        self.previous_models: list = []  # list to store failed calls (passed in as metadata to next call)
+        self.previous_models: deque = deque(
+            maxlen=4
+        )  # bounded store of failed calls (passed in as metadata to next call)
 
         # make Router.chat.completions.create compatible for openai.chat.completions.create
         default_litellm_params = default_litellm_params or {}
@@ -7117,7 +7121,8 @@ class Router:
         When a retry or fallback happens, log the details of the just failed model call - similar to Sentry breadcrumbing
         """
         try:
-            _metadata_var = "litellm_metadata" if "litellm_metadata" in kwargs else "metadata"
+            _metadata_var = self._get_metadata_variable_name_from_kwargs(kwargs)
+            excluded_keys = frozenset((_metadata_var, "messages", "original_function"))
             # Log failed model as the previous model
             previous_model = {
                 "exception_type": type(e).__name__,
@@ -7127,20 +7132,19 @@ class Router:
                 k,
                 v,
             ) in kwargs.items():  # log everything in kwargs except the old previous_models value - prevent nesting
-                if k not in [_metadata_var, "messages", "original_function"]:
+                if k not in excluded_keys:
                     previous_model[k] = v
                 elif k == _metadata_var and isinstance(v, dict):
-                    previous_model[_metadata_var] = {}  # type: ignore
-                    for metadata_k, metadata_v in kwargs[_metadata_var].items():
-                        if metadata_k != "previous_models":
-                            previous_model[k][metadata_k] = metadata_v  # type: ignore
-
-            # check current size of self.previous_models, if it's larger than 3, remove the first element
-            if len(self.previous_models) > 3:
-                self.previous_models.pop(0)
+                    previous_model[_metadata_var] = {  # pyright: ignore[reportArgumentType]  # kwargs values, not strs
+                        metadata_k: metadata_v for metadata_k, metadata_v in v.items() if metadata_k != "previous_models"
+                    }
 
+            # deque(maxlen=4) evicts the oldest entry in O(1) on append — no
+            # pop-front or slicing. Store a list snapshot in the metadata so
+            # downstream JSON serializers and len() checks see a plain list
+            # that later retries can't mutate from under them.
             self.previous_models.append(previous_model)
-            kwargs[_metadata_var]["previous_models"] = self.previous_models
+            kwargs[_metadata_var]["previous_models"] = list(self.previous_models)
             return kwargs
         except Exception as e:
             raise e
@@ -8274,55 +8278,34 @@ class Router:
         - model_id: str - the id of the deployment that was removed
         - removal_idx: int - the index where the deployment was removed from model_list
         """
-        # Update indices for all models after the removed one
-        for deployment_id, idx in self.model_id_to_deployment_index_map.items():
-            if idx > removal_idx:
-                self.model_id_to_deployment_index_map[deployment_id] = idx - 1
-        # Remove the deleted model from index
-        if model_id in self.model_id_to_deployment_index_map:
-            del self.model_id_to_deployment_index_map[model_id]
-
-        # Update model_name_to_deployment_indices
-        for model_name, indices in list(self.model_name_to_deployment_indices.items()):
-            # Build new list without mutating the original
-            updated_indices = []
-            for idx in indices:
-                if idx == removal_idx:
-                    # Skip the removed index
-                    continue
-                elif idx > removal_idx:
-                    # Decrement indices after removal
-                    updated_indices.append(idx - 1)
-                else:
-                    # Keep indices before removal unchanged
-                    updated_indices.append(idx)
-
-            # Update or remove the entry
-            if len(updated_indices) > 0:
-                self.model_name_to_deployment_indices[model_name] = updated_indices
-            else:
-                del self.model_name_to_deployment_indices[model_name]
-
-        # Update team_model_to_deployment_indices
-        for key, indices in list(self.team_model_to_deployment_indices.items()):
-            # Build new list without mutating the original
-            updated_indices = []
-            for idx in indices:
-                if idx == removal_idx:
-                    # Skip the removed index
-                    continue
-                elif idx > removal_idx:
-                    # Decrement indices after removal
-                    updated_indices.append(idx - 1)
-                else:
-                    # Keep indices before removal unchanged
-                    updated_indices.append(idx)
+        # Rebuild each index aside and publish it with a single attribute
+        # assignment (atomic under the GIL), so lock-free readers never
+        # observe a half-repaired map while indices shift.
+        self.model_id_to_deployment_index_map = {
+            deployment_id: idx - 1 if idx > removal_idx else idx
+            for deployment_id, idx in self.model_id_to_deployment_index_map.items()
+            if deployment_id != model_id
+        }
 
-            # Update or remove the entry
+        # Update model_name_to_deployment_indices: drop the removed index and
+        # shift down everything after it
+        new_model_name_indices = {}
+        for model_name, indices in self.model_name_to_deployment_indices.items():
+            updated_indices = [idx - 1 if idx > removal_idx else idx for idx in indices if idx != removal_idx]
             if len(updated_indices) > 0:
-                self.team_model_to_deployment_indices[key] = updated_indices
+                new_model_name_indices[model_name] = updated_indices
             else:
-                del self.team_model_to_deployment_indices[key]
+                # Keep the O(1) "does this model_name exist?" set in sync —
+                # otherwise deleted model names keep passing membership checks.
+                self.model_names.discard(model_name)
+        self.model_name_to_deployment_indices = new_model_name_indices
+
+        # Update team_model_to_deployment_indices the same way
+        self.team_model_to_deployment_indices = {
+            key: updated_indices
+            for key, indices in self.team_model_to_deployment_indices.items()
+            if (updated_indices := [idx - 1 if idx > removal_idx else idx for idx in indices if idx != removal_idx])
+        }
         self.team_public_model_names = frozenset(
             public_model_name for _, public_model_name in self.team_model_to_deployment_indices
         )
@@ -8364,8 +8347,18 @@ class Router:
         self._invalidate_model_group_info_cache()
         self._invalidate_access_groups_cache()
 
+        # Intern hot routing keys so the per-request dict lookups and equality
+        # checks on them hit CPython's pointer-comparison fast path.
+        if isinstance(model.get("model_name"), str):
+            model["model_name"] = sys.intern(model["model_name"])
+        model_info = model.get("model_info", {})
+        if isinstance(model_info.get("id"), str):
+            model_info["id"] = sys.intern(model_info["id"])
+
         # Update model_id index for O(1) lookup
         if model_id is not None:
+            if isinstance(model_id, str):
+                model_id = sys.intern(model_id)
             self.model_id_to_deployment_index_map[model_id] = idx
         elif model.get("model_info", {}).get("id") is not None:
             self.model_id_to_deployment_index_map[model["model_info"]["id"]] = idx
@@ -8373,9 +8366,7 @@ class Router:
         # Update model_name index for O(1) lookup
         model_name = model.get("model_name")
         if model_name:
-            if model_name not in self.model_name_to_deployment_indices:
-                self.model_name_to_deployment_indices[model_name] = []
-            self.model_name_to_deployment_indices[model_name].append(idx)
+            self.model_name_to_deployment_indices.setdefault(model_name, []).append(idx)
 
         # Update team_model index for O(1) team-scoped lookup
         self._update_team_model_index(model, idx)
@@ -8945,26 +8936,21 @@ class Router:
         model_list = self.get_model_list(model_name=model_group)
         if model_list is None:
             return None
+        is_wildcard_match = self.pattern_router.route(model_group) is not None
         for model in model_list:
-            is_match = False
-            if (
-                "model_name" in model
-                and model["model_name"] == model_group
-                or "model_name" in model
-                and self.pattern_router.route(model_group) is not None
-            ):  # exact match
-                is_match = True
+            is_match = "model_name" in model and (model["model_name"] == model_group or is_wildcard_match)
 
             if not is_match:
                 continue
             # model in model group found #
-            litellm_params = LiteLLM_Params(**model["litellm_params"])  # type: ignore
-            # get configurable clientside auth params
-            configurable_clientside_auth_params = litellm_params.configurable_clientside_auth_params
-
-            # Cache nested dict access to avoid repeated temporary dict allocations
-            model_litellm_params = model.get("litellm_params", {})
+            # Cache nested dict access to avoid repeated temporary dict allocations.
+            # Read fields straight off the dict instead of building a full
+            # LiteLLM_Params pydantic model per deployment — only three fields
+            # are needed here and none are transformed by validation.
+            model_litellm_params = model["litellm_params"]
             model_info_dict = model.get("model_info", {})
+            litellm_params_model: str = model_litellm_params.get("model", "")
+            configurable_clientside_auth_params = model_litellm_params.get("configurable_clientside_auth_params")
 
             # get model tpm
             _deployment_tpm: int | None = None
@@ -9000,7 +8986,7 @@ class Router:
             try:
                 model_id = model_info_dict.get("id", None)
                 if model_id is not None:
-                    model_info = self.get_deployment_model_info(model_id=model_id, model_name=litellm_params.model)
+                    model_info = self.get_deployment_model_info(model_id=model_id, model_name=litellm_params_model)
                 else:
                     model_info = None
             except Exception:
@@ -9010,8 +8996,8 @@ class Router:
             litellm_model, llm_provider = "", ""
             try:
                 litellm_model, llm_provider, _, _ = litellm.get_llm_provider(
-                    model=litellm_params.model,
-                    custom_llm_provider=litellm_params.custom_llm_provider,
+                    model=litellm_params_model,
+                    custom_llm_provider=model_litellm_params.get("custom_llm_provider"),
                 )
             except litellm.exceptions.BadRequestError as e:
                 verbose_router_logger.error(f"litellm.router.py::get_model_group_info() - {e!s}")
@@ -9316,13 +9302,20 @@ class Router:
 
         return total_itpm, total_otpm
 
-    @lru_cache(maxsize=DEFAULT_MAX_LRU_CACHE_SIZE)
     def _cached_get_model_group_info(self, model_group: str) -> ModelGroupInfo | None:
         """
         Cached version of get_model_group_info, uses @lru_cache wrapper
 
         This is a speed optimization, since set_response_headers makes a call to get_model_group_info on every request
+
+        Keyed by ``self._model_list_version`` so that invalidating one router's
+        cache (via a version bump) does not evict cached entries belonging to
+        other router instances sharing the class-level LRU cache.
         """
+        return self._versioned_get_model_group_info(sys.intern(model_group), self._model_list_version)
+
+    @lru_cache(maxsize=DEFAULT_MAX_LRU_CACHE_SIZE)
+    def _versioned_get_model_group_info(self, model_group: str, _model_list_version: int) -> ModelGroupInfo | None:
         return self.get_model_group_info(model_group)
 
     async def get_remaining_model_group_usage(self, model_group: str) -> dict[str, int]:
@@ -9409,9 +9402,7 @@ class Router:
         for idx, model in enumerate(model_list):
             model_name = model.get("model_name")
             if model_name:
-                if model_name not in self.model_name_to_deployment_indices:
-                    self.model_name_to_deployment_indices[model_name] = []
-                self.model_name_to_deployment_indices[model_name].append(idx)
+                self.model_name_to_deployment_indices.setdefault(model_name, []).append(idx)
 
             self._update_team_model_index(model, idx)
 
@@ -9884,12 +9875,15 @@ class Router:
         """Invalidate the cached model group info.
 
         Call this whenever self.model_list is modified to ensure the cache is rebuilt.
+        Bumps ``self._model_list_version`` so cached entries for the old model
+        list become unreachable (they age out of the LRU) without clearing the
+        class-level cache shared by other router instances.
         Also clears the auth-layer zero-cost cache, which depends on the same
         ``ModelGroupInfo`` data — without this, an in-place pricing update on
         an existing deployment (same model count) would keep a stale ``True``
         result and bypass budget enforcement.
         """
-        self._cached_get_model_group_info.cache_clear()
+        self._model_list_version += 1
         self._zero_cost_cache.clear()
 
     def _invalidate_access_groups_cache(self) -> None:
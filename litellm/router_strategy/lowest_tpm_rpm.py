@@ -1,7 +1,7 @@
 #### What this does ####
 #   identifies lowest tpm deployment
+import time
 import traceback
-from datetime import datetime
 
 from litellm import token_counter
 from litellm._logging import verbose_router_logger
@@ -48,25 +48,19 @@ class LowestTPMLoggingHandler(CustomLogger):
                 # ------------
                 # Setup values
                 # ------------
-                current_minute = datetime.now().strftime("%H-%M")
-                tpm_key = f"{model_group}:tpm:{current_minute}"
-                rpm_key = f"{model_group}:rpm:{current_minute}"
+                current_minute = int(time.time() // 60)
+                tpm_key = f"{model_group}:tpm:{current_minute}:{id}"
+                rpm_key = f"{model_group}:rpm:{current_minute}:{id}"
 
                 # ------------
                 # Update usage
                 # ------------
 
                 ## TPM
-                request_count_dict = self.router_cache.get_cache(key=tpm_key) or {}
-                request_count_dict[id] = request_count_dict.get(id, 0) + total_tokens
-
-                self.router_cache.set_cache(key=tpm_key, value=request_count_dict, ttl=self.routing_args.ttl)
+                self.router_cache.increment_cache(key=tpm_key, value=total_tokens, ttl=self.routing_args.ttl)
 
                 ## RPM
-                request_count_dict = self.router_cache.get_cache(key=rpm_key) or {}
-                request_count_dict[id] = request_count_dict.get(id, 0) + 1
-
-                self.router_cache.set_cache(key=rpm_key, value=request_count_dict, ttl=self.routing_args.ttl)
+                self.router_cache.increment_cache(key=rpm_key, value=1, ttl=self.routing_args.ttl)
 
                 ### TESTING ###
                 if self.test_flag:
@@ -105,9 +99,9 @@ class LowestTPMLoggingHandler(CustomLogger):
                 # ------------
                 # Setup values
                 # ------------
-                current_minute = datetime.now().strftime("%H-%M")
-                tpm_key = f"{model_group}:tpm:{current_minute}"
-                rpm_key = f"{model_group}:rpm:{current_minute}"
+                current_minute = int(time.time() // 60)
+                tpm_key = f"{model_group}:tpm:{current_minute}:{id}"
+                rpm_key = f"{model_group}:rpm:{current_minute}:{id}"
 
                 # ------------
                 # Update usage
@@ -115,20 +109,12 @@ class LowestTPMLoggingHandler(CustomLogger):
                 # update cache
 
                 ## TPM
-                request_count_dict = await self.router_cache.async_get_cache(key=tpm_key) or {}
-                request_count_dict[id] = request_count_dict.get(id, 0) + total_tokens
-
-                await self.router_cache.async_set_cache(
-                    key=tpm_key, value=request_count_dict, ttl=self.routing_args.ttl
+                await self.router_cache.async_increment_cache(
+                    key=tpm_key, value=total_tokens, ttl=self.routing_args.ttl
                 )
 
                 ## RPM
-                request_count_dict = await self.router_cache.async_get_cache(key=rpm_key) or {}
-                request_count_dict[id] = request_count_dict.get(id, 0) + 1
-
-                await self.router_cache.async_set_cache(
-                    key=rpm_key, value=request_count_dict, ttl=self.routing_args.ttl
-                )
+                await self.router_cache.async_increment_cache(key=rpm_key, value=1, ttl=self.routing_args.ttl)
 
                 ### TESTING ###
                 if self.test_flag:
@@ -153,14 +139,19 @@ class LowestTPMLoggingHandler(CustomLogger):
         verbose_router_logger.debug(
             f"get_available_deployments - Usage Based. model_group: {model_group}, healthy_deployments: {healthy_deployments}"
         )
-        current_minute = datetime.now().strftime("%H-%M")
-        tpm_key = f"{model_group}:tpm:{current_minute}"
-        rpm_key = f"{model_group}:rpm:{current_minute}"
-
-        tpm_dict = self.router_cache.get_cache(key=tpm_key)
-        rpm_dict = self.router_cache.get_cache(key=rpm_key)
-
-        verbose_router_logger.debug(f"tpm_key={tpm_key}, tpm_dict: {tpm_dict}, rpm_dict: {rpm_dict}")
+        current_minute = int(time.time() // 60)
+        deployment_ids: tuple[str, ...] = tuple(m["model_info"]["id"] for m in healthy_deployments)
+        tpm_keys = tuple(f"{model_group}:tpm:{current_minute}:{m_id}" for m_id in deployment_ids)
+        rpm_keys = tuple(f"{model_group}:rpm:{current_minute}:{m_id}" for m_id in deployment_ids)
+
+        tpm_dict = {  # mutable-ok: lookup table iterated and keyed below
+            m_id: self.router_cache.get_cache(key=key) or 0 for m_id, key in zip(deployment_ids, tpm_keys)
+        }
+        rpm_dict = {  # mutable-ok: lookup table keyed below
+            m_id: self.router_cache.get_cache(key=key) or 0 for m_id, key in zip(deployment_ids, rpm_keys)
+        }
+
+        verbose_router_logger.debug(f"tpm_keys={tpm_keys}, tpm_dict: {tpm_dict}, rpm_dict: {rpm_dict}")
         try:
             input_tokens = token_counter(messages=messages, text=input)
         except Exception:
@@ -171,17 +162,6 @@ class LowestTPMLoggingHandler(CustomLogger):
         # ----------------------
         lowest_tpm = float("inf")
 
-        if tpm_dict is None:  # base case - none of the deployments have been used
-            # initialize a tpm dict with {model_id: 0}
-            tpm_dict = {}
-            for deployment in healthy_deployments:
-                tpm_dict[deployment["model_info"]["id"]] = 0
-        else:
-            for d in healthy_deployments:
-                ## if healthy deployment not yet used
-                if d["model_info"]["id"] not in tpm_dict:
-                    tpm_dict[d["model_info"]["id"]] = 0
-
         all_deployments = tpm_dict
 
         deployment = None
@@ -215,11 +195,8 @@ class LowestTPMLoggingHandler(CustomLogger):
             if _deployment_rpm is None:
                 _deployment_rpm = float("inf")
 
-            if (
-                item_tpm + input_tokens > _deployment_tpm
-                or (rpm_dict is not None and item in rpm_dict)
-                and (rpm_dict[item] + 1 >= _deployment_rpm)
-            ):
+            item_rpm = rpm_dict.get(item, 0)
+            if item_tpm + input_tokens > _deployment_tpm or (item_rpm > 0 and item_rpm + 1 >= _deployment_rpm):
                 continue
             elif item_tpm < lowest_tpm:
                 lowest_tpm = item_tpm
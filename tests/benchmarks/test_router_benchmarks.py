@@ -0,0 +1,49 @@
+"""
+Performance benchmarks for Router hot-path lookups.
+
+These cover the model group info path exercised on every request by
+response-header construction and the dynamic rate limiter: the versioned
+lru_cache hit, the uncached rebuild, and retry bookkeeping.
+"""
+
+import pytest
+
+import litellm
+
+
+def _make_router(num_deployments: int = 50) -> litellm.Router:
+    return litellm.Router(
+        model_list=[
+            {
+                "model_name": "gpt-bench",
+                "litellm_params": {"model": "gpt-3.5-turbo", "api_key": "fake"},
+                "model_info": {"id": f"bench-{i}", "tpm": 10, "rpm": 100},
+            }
+            for i in range(num_deployments)
+        ]
+    )
+
+
+ROUTER = _make_router()
+ROUTER._cached_get_model_group_info("gpt-bench")
+
+
+@pytest.mark.benchmark
+def test_get_model_group_info_cached():
+    """Benchmark the versioned lru_cache hit path."""
+    ROUTER._cached_get_model_group_info("gpt-bench")
+
+
+@pytest.mark.benchmark
+def test_get_model_group_info_uncached():
+    """Benchmark a full model group info rebuild."""
+    ROUTER.get_model_group_info("gpt-bench")
+
+
+@pytest.mark.benchmark
+def test_log_retry():
+    """Benchmark per-retry bookkeeping in log_retry."""
+    ROUTER.log_retry(
+        kwargs={"model": "gpt-bench", "metadata": {"model_group": "gpt-bench"}},
+        e=ValueError("benchmark failure"),
+    )
@@ -146,3 +146,20 @@ def test_exact_cache_key_still_includes_prompt():
         model="gpt-4o-mini", messages=[{"role": "user", "content": "b"}]
     )
     assert key_a != key_b
+
+
+def test_cache_default_supported_call_types_are_per_instance():
+    from litellm.caching.caching import DEFAULT_SUPPORTED_CALL_TYPES
+
+    cache_a = Cache(type=LiteLLMCacheType.LOCAL)
+    assert tuple(cache_a.supported_call_types) == DEFAULT_SUPPORTED_CALL_TYPES
+
+    cache_a.supported_call_types.remove("completion")
+    cache_b = Cache(type=LiteLLMCacheType.LOCAL)
+    assert "completion" in cache_b.supported_call_types
+    assert "completion" in DEFAULT_SUPPORTED_CALL_TYPES
+
+
+def test_cache_explicit_supported_call_types_respected():
+    cache = Cache(type=LiteLLMCacheType.LOCAL, supported_call_types=["completion"])
+    assert cache.supported_call_types == ["completion"]
@@ -20,6 +20,17 @@ from unittest.mock import AsyncMock
 from litellm.caching.in_memory_cache import InMemoryCache
 
 
+class _FakeClock:
+    def __init__(self):
+        self.now = time.time()
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+    def __call__(self) -> float:
+        return self.now
+
+
 class _SlowInt(int):
     def __add__(self, value: int) -> "_SlowInt":
         time.sleep(0.05)
@@ -72,7 +83,7 @@ def test_in_memory_cache_max_size_per_item():
     """
     in_memory_cache = InMemoryCache(max_size_per_item=100)
 
-    result = in_memory_cache.check_value_size("a" * 100000000)
+    result = in_memory_cache.check_value_size("a" * (101 * 1024))
 
     assert result is False
 
@@ -83,7 +94,8 @@ def test_in_memory_cache_ttl():
     - if ttl is not set, it will be set to default ttl
     - if object expires, the ttl is also removed
     """
-    in_memory_cache = InMemoryCache()
+    clock = _FakeClock()
+    in_memory_cache = InMemoryCache(time_fn=clock)
 
     in_memory_cache.set_cache(key="my-fake-key", value="my-fake-value", ttl=10)
     initial_ttl_time = in_memory_cache.ttl_dict["my-fake-key"]
@@ -97,8 +109,9 @@ def test_in_memory_cache_ttl():
     in_memory_cache.set_cache(key="new-fake-key", value="new-fake-value", ttl=1)
     new_ttl_time = in_memory_cache.ttl_dict["new-fake-key"]
     assert new_ttl_time is not None
-    time.sleep(1)
+    clock.advance(1.1)
     cached_obj = in_memory_cache.get_cache(key="new-fake-key")
+    assert cached_obj is None
     new_ttl_time = in_memory_cache.ttl_dict.get("new-fake-key")
     assert new_ttl_time is None
 
@@ -109,12 +122,13 @@ def test_in_memory_cache_ttl_allow_override():
     - if ttl is not set, it will be set to default ttl
     - if object expires, the ttl is also removed
     """
-    in_memory_cache = InMemoryCache()
+    clock = _FakeClock()
+    in_memory_cache = InMemoryCache(time_fn=clock)
     ## On object expiration, but no get_cache, the override should be allowed
     in_memory_cache.set_cache(key="new-fake-key", value="new-fake-value", ttl=1)
     initial_ttl_time = in_memory_cache.ttl_dict["new-fake-key"]
     assert initial_ttl_time is not None
-    time.sleep(1)
+    clock.advance(1.1)
 
     in_memory_cache.set_cache(key="new-fake-key", value="new-fake-value-2", ttl=1)
     new_ttl_time = in_memory_cache.ttl_dict["new-fake-key"]
@@ -255,3 +269,45 @@ def test_in_memory_cache_prunes_expired_heap_entries_below_capacity():
     assert len(in_memory_cache.cache_dict) == 5
     assert len(in_memory_cache.ttl_dict) == 5
     assert len(in_memory_cache.expiration_heap) == 5
+
+
+def test_increment_cache_fast_path_preserves_ttl_and_value():
+    """Incrementing a live numeric counter must not reset its TTL or touch the
+    expiration heap, and must still read back correctly."""
+    cache = InMemoryCache()
+    cache.increment_cache("counter", 1, ttl=60)
+    initial_ttl = cache.ttl_dict["counter"]
+    heap_size = len(cache.expiration_heap)
+
+    assert cache.increment_cache("counter", 2, ttl=60) == 3
+    assert cache.ttl_dict["counter"] == initial_ttl
+    assert len(cache.expiration_heap) == heap_size
+    assert cache.get_cache("counter") == 3
+
+
+def test_increment_cache_expired_counter_restarts():
+    """An expired counter must restart from the increment value with a fresh TTL."""
+    cache = InMemoryCache()
+    cache.increment_cache("counter", 5, ttl=0.01)
+    time.sleep(0.05)
+    assert cache.increment_cache("counter", 1, ttl=60) == 1
+
+
+def test_increment_cache_concurrent_distinct_keys():
+    """Concurrent increments across many distinct keys must all land, with
+    per-key totals intact."""
+    cache = InMemoryCache(max_size_in_memory=500)
+    key_count = 16
+    increments_per_key = 25
+    barrier = threading.Barrier(key_count)
+
+    def worker(key_idx: int) -> None:
+        barrier.wait()
+        for _ in range(increments_per_key):
+            cache.increment_cache(f"counter-{key_idx}", 1, ttl=60)
+
+    with ThreadPoolExecutor(max_workers=key_count) as executor:
+        tuple(executor.map(worker, range(key_count)))
+
+    for key_idx in range(key_count):
+        assert cache.get_cache(f"counter-{key_idx}") == increments_per_key
@@ -5862,3 +5862,33 @@ def test_adaptive_thinking_dropped_when_max_tokens_too_small_converse():
     )
 
     assert "thinking" not in optional_params
+
+
+def test_convert_consecutive_user_messages_to_guarded_text_does_not_mutate_input():
+    """The guarded_text conversion must return copies; the caller's message
+    list is reused for retries/fallbacks and must stay untouched."""
+    import copy
+
+    messages = [
+        {"role": "system", "content": "You are a helpful assistant."},
+        {
+            "role": "user",
+            "content": [{"type": "text", "text": "Summarize this document."}],
+        },
+        {"role": "user", "content": "And translate it to French."},
+    ]
+    original = copy.deepcopy(messages)
+    optional_params = {
+        "guardrailConfig": {
+            "guardrailIdentifier": "gr-abc123",
+            "guardrailVersion": "DRAFT",
+        }
+    }
+
+    result = AmazonConverseConfig._convert_consecutive_user_messages_to_guarded_text(
+        messages=messages, optional_params=optional_params
+    )
+
+    assert messages == original
+    assert result[1]["content"][0]["type"] == "guarded_text"
+    assert result[2]["content"] == [{"type": "guarded_text", "text": "And translate it to French."}]
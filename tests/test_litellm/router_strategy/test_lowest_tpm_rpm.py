@@ -0,0 +1,96 @@
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.abspath("../../.."))
+
+from litellm.caching.caching import DualCache
+from litellm.router_strategy.lowest_tpm_rpm import LowestTPMLoggingHandler
+
+HEALTHY_DEPLOYMENTS = [
+    {"model_info": {"id": "deployment-a"}, "litellm_params": {"tpm": 1000, "rpm": 100}},
+    {"model_info": {"id": "deployment-b"}, "litellm_params": {"tpm": 1000, "rpm": 100}},
+]
+
+
+def _success_kwargs(deployment_id: str) -> dict:
+    return {
+        "litellm_params": {
+            "metadata": {"model_group": "gpt-group"},
+            "model_info": {"id": deployment_id},
+        }
+    }
+
+
+def _make_handler() -> LowestTPMLoggingHandler:
+    return LowestTPMLoggingHandler(router_cache=DualCache())
+
+
+def test_get_available_deployments_picks_lowest_tpm():
+    handler = _make_handler()
+    handler.log_success_event(_success_kwargs("deployment-a"), {"usage": {"total_tokens": 500}}, None, None)
+    handler.log_success_event(_success_kwargs("deployment-b"), {"usage": {"total_tokens": 10}}, None, None)
+
+    picked = handler.get_available_deployments(
+        model_group="gpt-group", healthy_deployments=HEALTHY_DEPLOYMENTS, input="hello"
+    )
+    assert picked["model_info"]["id"] == "deployment-b"
+
+
+def test_get_available_deployments_unused_deployments_are_candidates():
+    handler = _make_handler()
+    handler.log_success_event(_success_kwargs("deployment-a"), {"usage": {"total_tokens": 500}}, None, None)
+
+    picked = handler.get_available_deployments(
+        model_group="gpt-group", healthy_deployments=HEALTHY_DEPLOYMENTS, input="hello"
+    )
+    assert picked["model_info"]["id"] == "deployment-b"
+
+
+def test_get_available_deployments_respects_tpm_limit():
+    handler = _make_handler()
+    handler.log_success_event(_success_kwargs("deployment-a"), {"usage": {"total_tokens": 999}}, None, None)
+    handler.log_success_event(_success_kwargs("deployment-b"), {"usage": {"total_tokens": 1000}}, None, None)
+
+    picked = handler.get_available_deployments(
+        model_group="gpt-group", healthy_deployments=HEALTHY_DEPLOYMENTS, input="x"
+    )
+    assert picked["model_info"]["id"] == "deployment-a"
+
+
+def test_get_available_deployments_rpm_one_serves_first_request():
+    handler = _make_handler()
+    deployments = [{"model_info": {"id": "deployment-a"}, "litellm_params": {"tpm": 1000, "rpm": 1}}]
+
+    picked = handler.get_available_deployments(
+        model_group="gpt-group", healthy_deployments=deployments, input="hello"
+    )
+    assert picked is not None
+    assert picked["model_info"]["id"] == "deployment-a"
+
+    handler.log_success_event(_success_kwargs("deployment-a"), {"usage": {"total_tokens": 5}}, None, None)
+    picked = handler.get_available_deployments(
+        model_group="gpt-group", healthy_deployments=deployments, input="hello"
+    )
+    assert picked is None
+
+
+def test_concurrent_success_events_do_not_lose_updates():
+    handler = _make_handler()
+    num_events = 200
+
+    def record(_: int) -> None:
+        handler.log_success_event(_success_kwargs("deployment-a"), {"usage": {"total_tokens": 1}}, None, None)
+
+    import time
+
+    minute_before = int(time.time() // 60)
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        list(pool.map(record, range(num_events)))
+    minute_after = int(time.time() // 60)
+
+    minutes = {minute_before, minute_after}
+    tpm_total = sum(handler.router_cache.get_cache(key=f"gpt-group:tpm:{m}:deployment-a") or 0 for m in minutes)
+    rpm_total = sum(handler.router_cache.get_cache(key=f"gpt-group:rpm:{m}:deployment-a") or 0 for m in minutes)
+    assert tpm_total == num_events
+    assert rpm_total == num_events
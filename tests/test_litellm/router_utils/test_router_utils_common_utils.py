@@ -348,7 +348,7 @@ class TestFilterWebSearchDeployments:
 
 
 def test_invalidate_model_group_info_cache():
-    """Test that _invalidate_model_group_info_cache clears the LRU cache."""
+    """Test that _invalidate_model_group_info_cache bumps the model list version."""
     router = Router(
         model_list=[
             {
@@ -358,12 +358,34 @@ def test_invalidate_model_group_info_cache():
         ]
     )
     # Populate the cache
-    router._cached_get_model_group_info("gpt-4")
-    assert router._cached_get_model_group_info.cache_info().currsize > 0
+    result1 = router._cached_get_model_group_info("gpt-4")
+    assert router._cached_get_model_group_info("gpt-4") is result1
 
-    # Invalidate and verify cache is cleared
+    # Invalidate and verify the cached entry is no longer served
+    version_before = router._model_list_version
     router._invalidate_model_group_info_cache()
-    assert router._cached_get_model_group_info.cache_info().currsize == 0
+    assert router._model_list_version == version_before + 1
+    assert router._cached_get_model_group_info("gpt-4") is not result1
+
+
+def test_invalidate_model_group_info_cache_does_not_evict_other_routers():
+    """Invalidating one router's cache must not evict another router's cached entries."""
+    model_list = [
+        {
+            "model_name": "gpt-4",
+            "litellm_params": {"model": "gpt-4", "api_key": "fake-key"},
+        }
+    ]
+    router_a = Router(model_list=model_list)
+    router_b = Router(model_list=model_list)
+
+    result_a = router_a._cached_get_model_group_info("gpt-4")
+    result_b = router_b._cached_get_model_group_info("gpt-4")
+
+    router_a._invalidate_model_group_info_cache()
+
+    assert router_a._cached_get_model_group_info("gpt-4") is not result_a
+    assert router_b._cached_get_model_group_info("gpt-4") is result_b
 
 
 def test_filter_deployments_by_model_access_groups_access_group_only_key():
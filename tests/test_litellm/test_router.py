@@ -6574,3 +6574,36 @@ def test_model_info_is_active_for_environment_matrix(monkeypatch):
     monkeypatch.delenv("LITELLM_ENVIRONMENT")
     with pytest.raises(ValueError, match="LITELLM_ENVIRONMENT"):
         model_info_is_active_for_environment(model_info={"supported_environments": ["production"]})
+
+
+def test_delete_deployment_removes_model_name_from_membership_set():
+    """Deleting the last deployment of a model_name must remove it from
+    router.model_names, so O(1) existence checks don't match deleted models."""
+    router = litellm.Router(
+        model_list=[
+            {
+                "model_name": "gpt-solo",
+                "litellm_params": {"model": "gpt-3.5-turbo", "api_key": "fake"},
+                "model_info": {"id": "solo-1"},
+            },
+            {
+                "model_name": "gpt-duo",
+                "litellm_params": {"model": "gpt-3.5-turbo", "api_key": "fake"},
+                "model_info": {"id": "duo-1"},
+            },
+            {
+                "model_name": "gpt-duo",
+                "litellm_params": {"model": "gpt-4", "api_key": "fake"},
+                "model_info": {"id": "duo-2"},
+            },
+        ]
+    )
+
+    router.delete_deployment(id="solo-1")
+    assert "gpt-solo" not in router.model_names
+
+    router.delete_deployment(id="duo-1")
+    assert "gpt-duo" in router.model_names
+
+    router.delete_deployment(id="duo-2")
+    assert "gpt-duo" not in router.model_names